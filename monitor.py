@@ -2,8 +2,15 @@ import sys
 import time
 import os
 import difflib
+import hashlib
+import queue
+import re
+import threading
+from array import array
 from datetime import datetime
-from collections import deque
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import accumulate
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from rich.console import Console
@@ -13,195 +20,582 @@ from rich.prompt import Prompt
 from rich.live import Live
 from rich.layout import Layout
 from rich.text import Text
+from rich.progress import Progress
 from rich import box
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from blake3 import blake3 as content_hasher
+except ImportError:
+    content_hasher = hashlib.blake2b
+
 console = Console()
 
+# Events for the same path closer together than this are handled once,
+# but a path that keeps changing is still handled at least this often
+DEBOUNCE_SECONDS = 0.15
+DEBOUNCE_MAX_SECONDS = 1.0
+
+# The log writer thread batches entries for up to this long or this many bytes
+LOG_BATCH_SECONDS = 0.05
+LOG_BATCH_BYTES = 1 << 16
+
+# Directories that are never read (along with any hidden directory), and
+# limits for what counts as a text file
+IGNORED_DIRS = {'.git', 'node_modules', '__pycache__', 'venv', 'dist', 'build'}
+IGNORED_DIR_PATTERN = re.compile(
+    r'(?:^|[\\/])(?:\.[^\\/]*|' + '|'.join(map(re.escape, sorted(IGNORED_DIRS))) + r')[\\/]'
+)
+MAX_TRACK_BYTES = 1 << 20
+SNIFF_BYTES = 8192
+
+# Upper bound on cached file contents, and how often evictions are reported
+CACHE_MAX_BYTES = 128 << 20
+EVICTION_REPORT_SECONDS = 60
+
+# Emoji and rich color for each change type, and the markdown heading of a log entry
+CHANGE_STYLES = {
+    "MODIFIED": ("📝", "blue"),
+    "CREATED": ("🆕", "green"),
+    "DELETED": ("🗑️", "red"),
+}
+LOG_HEADER_TEMPLATE = "\n### {icon} [{timestamp}] {change_type}: `{rel_path}`\n"
+LOG_STATS_TEMPLATE = "- **Lines Added**: {added}\n- **Lines Removed**: {removed}\n"
+LOG_DIFF_OPEN = "\n<details>\n<summary>View Changes</summary>\n\n```diff\n"
+LOG_DIFF_CLOSE = "\n```\n\n</details>\n"
+
+# Lines are compared by 64-bit fingerprint rather than by string equality.
+# They are stored packed, unsigned for xxh3 and signed for the builtin hash().
+if xxhash is not None:
+    line_hash = xxhash.xxh3_64_intdigest
+    HASH_TYPECODE = 'Q'
+else:
+    line_hash = hash
+    HASH_TYPECODE = 'q'
+
+def index_lines(buf):
+    """Splits raw bytes into lines the way bytes.splitlines(keepends=True) does.
+
+    Returns the start offset of every line followed by len(buf), and a 64-bit
+    fingerprint per line. Nothing gets decoded.
+    """
+    lines = buf.splitlines(keepends=True)
+    offsets = array('I', [0])
+    offsets.extend(accumulate(map(len, lines)))
+    return offsets, array(HASH_TYPECODE, map(line_hash, lines))
+
+def is_trackable(buf):
+    """Rejects content that is too large or binary (a NUL byte near the start, as git does)."""
+    return len(buf) <= MAX_TRACK_BYTES and b'\0' not in buf[:SNIFF_BYTES]
+
+def decode_lines(buf, offsets, start, stop):
+    """Decodes lines start..stop of a cached file back into text.
+
+    CRLF and lone CR endings become a plain newline, as in a text-mode read, so
+    the text-mode log handle never doubles them on Windows or drops CR breaks.
+    """
+    for i in range(start, stop):
+        line = buf[offsets[i]:offsets[i + 1]].decode('utf-8', errors='ignore')
+        stripped = line.rstrip('\r\n')
+        yield stripped + '\n' if len(stripped) != len(line) else line
+
+def diff_opcodes(old_hashes, new_hashes):
+    """Returns SequenceMatcher opcodes for two lists of line fingerprints."""
+    return difflib.SequenceMatcher(None, old_hashes, new_hashes, autojunk=False).get_opcodes()
+
+def group_opcodes(opcodes, n=3):
+    """Splits opcodes into hunks with n lines of context, like SequenceMatcher.get_grouped_opcodes."""
+    codes = list(opcodes) or [('equal', 0, 1, 0, 1)]
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        # End the current hunk at a large run of unchanged lines
+        if tag == 'equal' and i2 - i1 > n * 2:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+def unified_diff(old, new, groups):
+    """Renders grouped opcodes as unified diff lines, like difflib.unified_diff.
+
+    old and new are (buf, offsets) pairs; only lines inside a hunk get decoded.
+    """
+    started = False
+    for group in groups:
+        if not started:
+            started = True
+            yield "--- Before\n"
+            yield "+++ After\n"
+        first, last = group[0], group[-1]
+        yield f"@@ -{format_range(first[1], last[2])} +{format_range(first[3], last[4])} @@\n"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in decode_lines(*old, i1, i2):
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in decode_lines(*old, i1, i2):
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in decode_lines(*new, j1, j2):
+                    yield '+' + line
+
+def format_range(start, stop):
+    """Formats a hunk range the same way as difflib's unified format."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+class FileCache:
+    """LRU cache of file contents keyed by path, bounded by total size in bytes."""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES):
+        self.entries = OrderedDict()
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def entry_size(self, entry):
+        # Raw bytes plus a 4-byte offset and an 8-byte fingerprint per line
+        buf, offsets = entry[0], entry[1]
+        return len(buf) + len(offsets) * 12
+
+    def get(self, file_path, default=None):
+        with self.lock:
+            item = self.entries.get(file_path)
+            if item is None:
+                return default
+            self.entries.move_to_end(file_path)
+            return item[0]
+
+    def put(self, file_path, entry):
+        size = self.entry_size(entry)
+        with self.lock:
+            old = self.entries.pop(file_path, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self.entries[file_path] = (entry, size)
+            self.total_bytes += size
+
+            # Evict least recently used files, but always keep the newest one
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+
+    def pop(self, file_path):
+        with self.lock:
+            item = self.entries.pop(file_path, None)
+            if item is not None:
+                self.total_bytes -= item[1]
+
+    def __len__(self):
+        return len(self.entries)
+
 class ChangeLogger:
     def __init__(self, watch_dir, event_callback=None):
         self.watch_dir = os.path.abspath(watch_dir)
-        self.file_cache = {}
+        self.watch_prefix = os.path.join(self.watch_dir, '')
+        self.cached_timestamp = (None, "")
+        self.file_cache = FileCache()
+        self.reported_evictions = 0
+        self.last_eviction_report = time.monotonic()
         self.log_file = os.path.join(self.watch_dir, "CHANGELOG_AUTO.md")
         self.event_callback = event_callback
+        self.log_fh = None
+        self.log_queue = queue.SimpleQueue()
         self.load_initial_state()
 
-    def read_file_safe(self, file_path, retries=5, delay=0.5):
-        """Attempts to read a file with retries to handle locking issues."""
+        # Disk writes happen on their own thread so a slow disk never stalls event handling
+        self.writer = threading.Thread(target=self.write_log_entries, daemon=True)
+        self.writer.start()
+
+    def read_file_safe(self, file_path, retries=5, delay=0.01):
+        """Attempts to read a file with retries to handle locking issues.
+
+        Backs off exponentially (10ms, 20ms, 40ms, ...) while the file is locked
+        or briefly missing during an editor's rename-into-place save.
+
+        Returns the raw bytes; they are read once and shared by the size and
+        binary checks, the digest, the line offsets and the fingerprints. At most
+        MAX_TRACK_BYTES + 1 bytes are read, enough to tell a file is too large.
+        """
         for i in range(retries):
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    return f.readlines()
-            except PermissionError:
+                with open(file_path, 'rb') as f:
+                    return f.read(MAX_TRACK_BYTES + 1)
+            except (PermissionError, FileNotFoundError):
                 if i < retries - 1:
-                    time.sleep(delay)
+                    time.sleep(delay * 2 ** i)
                 else:
                     raise
             except Exception:
                 raise
-        return []
+        return b''
 
     def load_initial_state(self):
         """Reads all files in the directory to establish a baseline."""
-        # Initialize the log file with a header if it doesn't exist
-        if not os.path.exists(self.log_file):
-            try:
-                with open(self.log_file, 'w', encoding='utf-8') as f:
-                    f.write(f"# Change Log\nStarted watching at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            except PermissionError:
-                pass # Can't write log, skip initialization
-        else:
-            try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(f"\n---\n\n## Session Start: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            except PermissionError:
-                pass
+        # Keep one buffered handle open for the whole session
+        is_new_log = not os.path.exists(self.log_file)
+        try:
+            self.log_fh = open(self.log_file, 'a', encoding='utf-8', buffering=1 << 16)
+            if is_new_log:
+                self.log_fh.write(f"# Change Log\nStarted watching at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            else:
+                self.log_fh.write(f"\n---\n\n## Session Start: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            self.log_fh.flush()
+        except PermissionError:
+            pass # Can't write log, keep watching without it
 
-        for root, dirs, files in os.walk(self.watch_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if file_path == self.log_file:
-                    continue
+        paths = [file_path for file_path in self.walk_files(self.watch_dir) if file_path != self.log_file]
+
+        # Reading is I/O bound, so threads overlap the stat/read latency
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with Progress(console=console, transient=True) as progress, ThreadPoolExecutor(max_workers=workers) as pool:
+            task = progress.add_task("Reading files...", total=len(paths))
+            futures = {pool.submit(self.load_file, file_path): file_path for file_path in paths}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                progress.advance(task)
                 try:
-                    self.file_cache[file_path] = self.read_file_safe(file_path, retries=1)
+                    loaded = future.result()
                 except Exception as e:
                     if self.event_callback:
                         self.event_callback(f"[yellow]Could not read {file_path}: {e}[/yellow]")
+                    continue
+                if loaded is not None:
+                    self.update_cache(file_path, *loaded)
 
+    def walk_files(self, dir_path):
+        """Yields the path of every file small enough to track, skipping ignored directories.
+
+        os.scandir hands back names, full paths and (usually) entry types with
+        the listing, so no path joins are needed. Sizes still cost one stat per
+        file on POSIX; only Windows fills them in from the listing.
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS and not entry.name.startswith('.'):
+                        yield from self.walk_files(entry.path)
+                elif entry.is_file() and entry.stat().st_size <= MAX_TRACK_BYTES:
+                    yield entry.path
+            except OSError:
+                continue
+
+    def load_file(self, file_path):
+        """Reads and fingerprints one file for the initial baseline, or returns None if it's binary.
+
+        The walk already applied the directory and size filters; the content
+        checks reuse the bytes read here instead of opening the file twice.
+        """
+        buf = self.read_file_safe(file_path, retries=1)
+        if not is_trackable(buf):
+            return None
+        return (buf, *index_lines(buf), content_hasher(buf).digest())
+
+    def relative_path(self, file_path):
+        # Event paths almost always sit under watch_dir, so slicing is enough
+        if file_path.startswith(self.watch_prefix):
+            return file_path[len(self.watch_prefix):]
+        return os.path.relpath(file_path, self.watch_dir)
+
+    def timestamp(self):
+        """Returns the current time as text, formatting it at most once per second."""
+        now = int(time.time())
+        second, text = self.cached_timestamp
+        if now != second:
+            text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self.cached_timestamp = (now, text)
+        return text
+
+    def is_ignored(self, file_path):
+        """Checks whether the file lives inside a hidden directory or one of the IGNORED_DIRS."""
+        return IGNORED_DIR_PATTERN.search(self.relative_path(file_path)) is not None
+
+    def get_diff_stats(self, file_path, new_buf, new_offsets, new_hashes):
+        """Diffs a file against its cached version; the text is rendered later, by log_change."""
+        # Files never seen (or evicted from the cache) diff against an empty baseline
+        old_buf, old_offsets, old_hashes, _ = self.file_cache.get(file_path, (b'', array('I', [0]), array(HASH_TYPECODE), None))
+
+        # Diffing the fingerprints keeps the matcher working on ints
+        opcodes = diff_opcodes(old_hashes, new_hashes)
 
-    def get_diff_stats(self, file_path, new_lines):
-        old_lines = self.file_cache.get(file_path, [])
-        
-        diff = list(difflib.unified_diff(
-            old_lines, 
-            new_lines, 
-            fromfile='Before', 
-            tofile='After', 
-            lineterm=''
-        ))
-        
         added = 0
         removed = 0
-        modified_content = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag != 'equal':
+                removed += i2 - i1
+                added += j2 - j1
 
-        for line in diff:
-            if line.startswith('---') or line.startswith('+++'):
-                continue
-            if line.startswith('+'):
-                added += 1
-                modified_content.append(f"ADDED: {line[1:].strip()}")
-            elif line.startswith('-'):
-                removed += 1
-                modified_content.append(f"REMOVED: {line[1:].strip()}")
-        
         return {
             'added': added,
             'removed': removed,
-            'diff_text': diff,
-            'details': modified_content
+            'opcodes': opcodes,
+            'old': (old_buf, old_offsets),
+            'new': (new_buf, new_offsets)
         }
 
+    def get_diff_text(self, old, new, opcodes):
+        """Renders opcodes between two cached (buf, offsets) versions as a list of unified diff lines."""
+        return list(unified_diff(old, new, group_opcodes(opcodes)))
+
     def log_change(self, file_path, change_type, stats=None):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        rel_path = os.path.relpath(file_path, self.watch_dir)
+        rel_path = self.relative_path(file_path)
         
         # Use emoji for different change types
-        icon = "📝"
-        color = "blue"
-        if change_type == "CREATED":
-            icon = "🆕"
-            color = "green"
-        elif change_type == "DELETED":
-            icon = "🗑️"
-            color = "red"
+        icon, color = CHANGE_STYLES.get(change_type, CHANGE_STYLES["MODIFIED"])
 
-        log_entry = f"\n### {icon} [{timestamp}] {change_type}: `{rel_path}`\n"
+        # Collect the pieces and join once; large diffs would make += quadratic
+        parts = [LOG_HEADER_TEMPLATE.format(icon=icon, timestamp=self.timestamp(), change_type=change_type, rel_path=rel_path)]
         
         summary_text = f"[{color}]{icon} {change_type}: {rel_path}[/{color}]"
         
         if stats:
-            log_entry += f"- **Lines Added**: {stats['added']}\n"
-            log_entry += f"- **Lines Removed**: {stats['removed']}\n"
+            parts.append(LOG_STATS_TEMPLATE.format(added=stats['added'], removed=stats['removed']))
             
             summary_text += f" (+{stats['added']} / -{stats['removed']})"
 
-            if stats['diff_text']:
-                log_entry += "\n<details>\n<summary>View Changes</summary>\n\n"
-                log_entry += "```diff\n"
-                for line in stats['diff_text']:
-                    log_entry += line
-                log_entry += "\n```\n"
-                log_entry += "\n</details>\n"
+            # The full diff is only computed here, for the log file
+            diff_lines = self.get_diff_text(stats['old'], stats['new'], stats['opcodes']) if 'opcodes' in stats else []
+            if diff_lines:
+                parts.append(LOG_DIFF_OPEN)
+                parts.extend(diff_lines)
+                parts.append(LOG_DIFF_CLOSE)
         
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-            
-            if self.event_callback:
-                self.event_callback(summary_text)
+        self.log_queue.put(("".join(parts), summary_text))
 
+    def write_log_entries(self):
+        """Writer thread: drains the log queue in batches of up to LOG_BATCH_SECONDS or LOG_BATCH_BYTES."""
+        running = True
+        while running:
+            item = self.log_queue.get()
+            batch = []
+            batch_bytes = 0
+            deadline = time.monotonic() + LOG_BATCH_SECONDS
+            while True:
+                if item is None: # Sentinel from close()
+                    running = False
+                    break
+                batch.append(item)
+                batch_bytes += len(item[0])
+                timeout = deadline - time.monotonic()
+                if batch_bytes >= LOG_BATCH_BYTES or timeout <= 0:
+                    break
+                try:
+                    item = self.log_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            if batch:
+                self.write_batch(batch)
+
+    def write_batch(self, batch):
+        try:
+            if self.log_fh is not None:
+                self.log_fh.write("".join(log_entry for log_entry, _ in batch))
+                self.log_fh.flush()
         except Exception as e:
             if self.event_callback:
                 self.event_callback(f"[red]Failed to write log: {e}[/red]")
+            return
+
+        if self.event_callback:
+            for _, summary_text in batch:
+                self.event_callback(summary_text)
+
+    def close(self):
+        """Writes out any queued entries and closes the log file."""
+        if self.writer.is_alive():
+            self.log_queue.put(None)
+            self.writer.join()
+        if self.log_fh is not None:
+            self.log_fh.close()
+            self.log_fh = None
 
-    def update_cache(self, file_path, new_lines):
-        self.file_cache[file_path] = new_lines
+    def update_cache(self, file_path, buf, offsets, new_hashes, digest=None):
+        # One bytes blob plus line offsets instead of a str object per line
+        if digest is None:
+            digest = content_hasher(buf).digest()
+        self.file_cache.put(file_path, (buf, offsets, new_hashes, digest))
+        self.report_evictions()
 
     def remove_from_cache(self, file_path):
-        if file_path in self.file_cache:
-            del self.file_cache[file_path]
+        self.file_cache.pop(file_path)
+
+    def report_evictions(self):
+        """Tells the UI how many files were dropped from the cache, at most once per EVICTION_REPORT_SECONDS."""
+        evicted = self.file_cache.evictions - self.reported_evictions
+        if not evicted or time.monotonic() - self.last_eviction_report < EVICTION_REPORT_SECONDS:
+            return
+        self.reported_evictions = self.file_cache.evictions
+        self.last_eviction_report = time.monotonic()
+        if self.event_callback:
+            self.event_callback(f"[dim]Evicted {evicted} file(s) from the cache ({self.file_cache.total_bytes >> 20} MiB held)[/dim]")
+
+def merge_change_types(previous, current):
+    """Collapses two pending events for the same path into one, or None if they cancel out."""
+    if current == "DELETED":
+        # A file created and removed inside the window (editor temp files, probes) never happened
+        return None if previous == "CREATED" else "DELETED"
+    if previous == "CREATED":
+        return "CREATED"
+    if previous == "DELETED":
+        # Deleted and written again inside the window, e.g. an editor's atomic save
+        return "MODIFIED"
+    return current
 
 class Handler(FileSystemEventHandler):
     def __init__(self, logger):
         self.logger = logger
+        # Events arrive with absolute paths since the observer is scheduled on one
+        self.log_path = os.path.abspath(logger.log_file)
+        self.events = queue.Queue()
+        self.pending = {}
+        self.worker = threading.Thread(target=self.process_events, daemon=True)
+        self.worker.start()
 
     def on_modified(self, event):
         if event.is_directory: return
-        if os.path.abspath(event.src_path) == os.path.abspath(self.logger.log_file): return
-        
+        if event.src_path == self.log_path: return
+        if self.logger.is_ignored(event.src_path): return
+        self.events.put((event.src_path, "MODIFIED", time.monotonic()))
+
+    def on_created(self, event):
+        if event.is_directory: return
+        if event.src_path == self.log_path: return
+        if self.logger.is_ignored(event.src_path): return
+        self.events.put((event.src_path, "CREATED", time.monotonic()))
+
+    def on_deleted(self, event):
+        if event.is_directory: return
+        if event.src_path == self.log_path: return
+        if self.logger.is_ignored(event.src_path): return
+        self.events.put((event.src_path, "DELETED", time.monotonic()))
+
+    def process_events(self):
+        """Worker loop: handles a path once no new event for it arrived within DEBOUNCE_SECONDS,
+        or DEBOUNCE_MAX_SECONDS after its first pending event, whichever comes first."""
+        running = True
+        while running:
+            timeout = None
+            if self.pending:
+                next_deadline = min(deadline for _, deadline, _ in self.pending.values())
+                timeout = max(0, next_deadline - time.monotonic())
+
+            try:
+                file_path, change_type, stamp = self.events.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if file_path is None: # Sentinel from stop(): handle everything still pending
+                    running = False
+                else:
+                    first_seen = stamp
+                    if file_path in self.pending:
+                        previous, _, first_seen = self.pending[file_path]
+                        change_type = merge_change_types(previous, change_type)
+                    if change_type is None:
+                        del self.pending[file_path]
+                    else:
+                        deadline = min(stamp + DEBOUNCE_SECONDS, first_seen + DEBOUNCE_MAX_SECONDS)
+                        self.pending[file_path] = (change_type, deadline, first_seen)
+
+            now = time.monotonic()
+            for file_path, (change_type, deadline, _) in list(self.pending.items()):
+                if deadline <= now or not running:
+                    del self.pending[file_path]
+                    self.process_event(file_path, change_type)
+
+    def stop(self):
+        """Handles any pending events and waits for the worker thread to exit."""
+        if self.worker.is_alive():
+            self.events.put((None, None, time.monotonic()))
+            self.worker.join()
+
+    def process_event(self, file_path, change_type):
+        if change_type == "CREATED":
+            self.handle_created(file_path)
+        elif change_type == "DELETED":
+            self.handle_deleted(file_path)
+        else:
+            self.handle_modified(file_path)
+
+    def handle_modified(self, file_path):
         try:
-            # Wait briefly to ensure write is complete
-            time.sleep(0.1)
-            new_lines = self.logger.read_file_safe(event.src_path)
+            buf = self.logger.read_file_safe(file_path)
+            if not is_trackable(buf):
+                self.logger.remove_from_cache(file_path)
+                return
+
+            # Saves that rewrite identical bytes don't need a diff at all
+            digest = content_hasher(buf).digest()
+            cached = self.logger.file_cache.get(file_path)
+            if cached is not None and cached[3] == digest:
+                return
+
+            offsets, new_hashes = index_lines(buf)
             
-            stats = self.logger.get_diff_stats(event.src_path, new_lines)
+            stats = self.logger.get_diff_stats(file_path, buf, offsets, new_hashes)
             
             # Only log if there are actual changes
-            if stats['added'] > 0 or stats['removed'] > 0:
-                self.logger.log_change(event.src_path, "MODIFIED", stats)
-                self.logger.update_cache(event.src_path, new_lines)
+            if stats['added'] or stats['removed']:
+                self.logger.log_change(file_path, "MODIFIED", stats)
+            self.logger.update_cache(file_path, buf, offsets, new_hashes, digest)
                 
         except Exception as e:
             pass
 
-    def on_created(self, event):
-        if event.is_directory: return
-        if os.path.abspath(event.src_path) == os.path.abspath(self.logger.log_file): return
-        
+    def handle_created(self, file_path):
         try:
-            # Give OS time to release handle on new files
-            time.sleep(0.1)
-            new_lines = self.logger.read_file_safe(event.src_path)
+            buf = self.logger.read_file_safe(file_path)
+            if not is_trackable(buf):
+                # Still logged, without stats, so it pairs with its later DELETED
+                self.logger.log_change(file_path, "CREATED")
+                return
+            offsets, new_hashes = index_lines(buf)
             
-            self.logger.update_cache(event.src_path, new_lines)
-            self.logger.log_change(event.src_path, "CREATED", {'added': len(new_lines), 'removed': 0, 'details': [], 'diff_text': []})
+            self.logger.update_cache(file_path, buf, offsets, new_hashes)
+            self.logger.log_change(file_path, "CREATED", {'added': len(offsets) - 1, 'removed': 0})
         except Exception as e:
             if self.logger.event_callback:
-                self.logger.event_callback(f"[red]Error processing creation for {event.src_path}: {e}[/red]")
+                self.logger.event_callback(f"[red]Error processing creation for {file_path}: {e}[/red]")
 
-    def on_deleted(self, event):
-        if event.is_directory: return
-        if os.path.abspath(event.src_path) == os.path.abspath(self.logger.log_file): return
-        
-        self.logger.remove_from_cache(event.src_path)
-        self.logger.log_change(event.src_path, "DELETED")
+    def handle_deleted(self, file_path):
+        self.logger.remove_from_cache(file_path)
+        self.logger.log_change(file_path, "DELETED")
 
 def start_watching(path, event_callback):
     logger = ChangeLogger(path, event_callback)
     event_handler = Handler(logger)
     observer = Observer()
-    observer.schedule(event_handler, path, recursive=True)
+    observer.schedule(event_handler, logger.watch_dir, recursive=True)
     observer.start()
-    return observer
+    return observer, event_handler, logger
 
 def make_layout():
     layout = Layout()
@@ -235,21 +629,31 @@ def main():
                 
                 # Setup Event Tracking
                 events = deque(maxlen=20)
+                events_version = 0
                 
                 def add_event(event_text):
+                    nonlocal events_version
                     timestamp = datetime.now().strftime("%H:%M:%S")
                     events.appendleft(f"[{timestamp}] {event_text}")
+                    events_version += 1
 
                 # Start Watching
-                observer = start_watching(watch_path, add_event)
+                observer, event_handler, logger = start_watching(watch_path, add_event)
                 
                 try:
                     layout = make_layout()
                     layout["header"].update(Panel(f"Watching: {watch_path}", style="bold green"))
                     layout["footer"].update(Panel("Press Ctrl+C to stop watching", style="bold red"))
                     
-                    with Live(layout, refresh_per_second=4, screen=True) as live:
+                    rendered_version = -1
+                    with Live(layout, refresh_per_second=2, screen=True) as live:
                         while True:
+                            # Only rebuild the table when new events came in
+                            if events_version == rendered_version:
+                                time.sleep(0.1)
+                                continue
+                            rendered_version = events_version
+
                             # Update Body with Table of Events
                             table = Table(box=box.SIMPLE, show_header=False, expand=True)
                             table.add_column("Event")
@@ -257,15 +661,16 @@ def main():
                             if not events:
                                 table.add_row("[dim]Waiting for changes...[/dim]")
                             else:
-                                for event in events:
+                                for event in list(events):
                                     table.add_row(event)
                             
                             layout["body"].update(Panel(table, title="Live Change Log", border_style="blue"))
-                            time.sleep(0.25)
                             
                 except KeyboardInterrupt:
                     observer.stop()
                     observer.join()
+                    event_handler.stop()
+                    logger.close()
                     console.print("[red]Stopped watching.[/red]")
                     time.sleep(1) # Let user see message
                 except Exception as e:
@@ -273,6 +678,8 @@ def main():
                     if observer:
                         observer.stop()
                         observer.join()
+                        event_handler.stop()
+                        logger.close()
             else:
                 console.print("[red]Invalid directory![/red]")
                 time.sleep(2)